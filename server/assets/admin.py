@@ -9,6 +9,7 @@ from .models import Asset, AssetCycle
 @admin.register(Asset)
 class AssetAdmin(ModelAdmin):
     list_display = ("asset_id", "site", "asset_type", "make", "model", "is_active")
+    list_select_related = ("site",)
     list_filter = ("asset_type", "is_active", "site")
     search_fields = ("asset_id", "make", "model")
     formfield_overrides = {
@@ -23,6 +24,7 @@ class AssetAdmin(ModelAdmin):
 @admin.register(AssetCycle)
 class AssetCycleAdmin(ModelAdmin):
     list_display = ("asset", "cycle_type", "start_time", "end_time", "duration")
+    list_select_related = ("asset",)
     list_filter = ("cycle_type", "start_time")
 
 
@@ -0,0 +1,28 @@
+from django.db import migrations
+
+
+def add_tags_gin_index(apps, schema_editor):
+    # GIN indexes only exist on PostgreSQL; the sqlite dev database keeps
+    # working without them.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS asset_tags_gin "
+        "ON assets_asset USING gin (tags jsonb_path_ops)"
+    )
+
+
+def drop_tags_gin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS asset_tags_gin")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("assets", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(add_tags_gin_index, drop_tags_gin_index),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.17 on 2026-08-30 00:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assets', '0002_asset_tags_gin'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='assetcycle',
+            name='_str',
+            field=models.CharField(blank=True, default='', editable=False, max_length=255),
+        ),
+    ]
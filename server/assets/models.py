@@ -2,7 +2,7 @@ import uuid
 
 from django.db import models
 
-from devices.models import Site
+from devices.models import Site, StaticRepresentationModel
 
 
 class Asset(models.Model):
@@ -44,7 +44,7 @@ class Asset(models.Model):
         return f"{self.asset_id} - {self.make} {self.model}"
 
 
-class AssetCycle(models.Model):
+class AssetCycle(StaticRepresentationModel):
     """Asset cycle tracking (e.g., door open/close cycles)"""
 
     asset = models.ForeignKey(Asset, on_delete=models.CASCADE, related_name="cycles")
@@ -63,5 +63,6 @@ class AssetCycle(models.Model):
             models.Index(fields=["asset", "cycle_type", "start_time"]),
         ]
 
-    def __str__(self):
+    @property
+    def static_representation(self):
         return f"{self.asset.asset_id} - {self.cycle_type} at {self.start_time}"
@@ -5,7 +5,7 @@ from .models import Asset, AssetCycle
 
 class AssetSerializer(serializers.ModelSerializer):
     site_name = serializers.CharField(source="site.name", read_only=True)
-    cycle_count = serializers.SerializerMethodField()
+    cycle_count = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = Asset
@@ -29,8 +29,27 @@ class AssetSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["id", "created_at", "updated_at"]
 
-    def get_cycle_count(self, obj):
-        return obj.cycles.count()
+
+class AssetListSerializer(AssetSerializer):
+    """Slim list representation omitting the heavy JSON columns"""
+
+    class Meta(AssetSerializer.Meta):
+        fields = [
+            "id",
+            "asset_id",
+            "site",
+            "site_name",
+            "asset_type",
+            "make",
+            "model",
+            "serial_number",
+            "installation_date",
+            "location",
+            "is_active",
+            "cycle_count",
+            "created_at",
+            "updated_at",
+        ]
 
 
 class AssetCycleSerializer(serializers.ModelSerializer):
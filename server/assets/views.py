@@ -1,30 +1,39 @@
+from django.db.models import Count
 from rest_framework import viewsets
 
 from .models import Asset, AssetCycle
-from .serializers import AssetCycleSerializer, AssetSerializer
+from .serializers import AssetCycleSerializer, AssetListSerializer, AssetSerializer
 
 
 class AssetViewSet(viewsets.ModelViewSet):
-    queryset = Asset.objects.all()
+    queryset = Asset.objects.none()
     serializer_class = AssetSerializer
 
+    def get_serializer_class(self):
+        if self.action == "list":
+            return AssetListSerializer
+        return AssetSerializer
+
     def get_queryset(self):
-        queryset = Asset.objects.select_related("site")
+        queryset = Asset.objects.select_related("site").annotate(
+            cycle_count=Count("cycles")
+        )
+        if self.action == "list":
+            # List responses omit the wide JSON columns entirely
+            queryset = queryset.defer("specifications", "tags")
         if self.request.user.is_authenticated:
             # Filter assets by user's site access
-            user_sites = self.request.user.sites.all()
-            return queryset.filter(site__in=user_sites)
+            return queryset.filter(site__customer=self.request.user)
         return queryset.none()
 
 
 class AssetCycleViewSet(viewsets.ModelViewSet):
-    queryset = AssetCycle.objects.all()
+    queryset = AssetCycle.objects.none()
     serializer_class = AssetCycleSerializer
 
     def get_queryset(self):
-        queryset = AssetCycle.objects.select_related("asset")
+        queryset = AssetCycle.objects.select_related("asset", "asset__site")
         if self.request.user.is_authenticated:
             # Filter by user's accessible assets
-            user_sites = self.request.user.sites.all()
-            return queryset.filter(asset__site__in=user_sites)
+            return queryset.filter(asset__site__customer=self.request.user)
         return queryset.none()
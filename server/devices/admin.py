@@ -9,12 +9,14 @@ from .models import Device, DeviceConfiguration, FirmwareBundle, Site
 @admin.register(Site)
 class SiteAdmin(ModelAdmin):
     list_display = ("name", "customer", "created_at", "updated_at")
+    list_select_related = ("customer",)
     search_fields = ("name", "customer__username")
 
 
 @admin.register(Device)
 class DeviceAdmin(ModelAdmin):
     list_display = ("serial_number", "model", "site", "status", "last_seen")
+    list_select_related = ("site",)
     list_filter = ("status", "model", "site")
     search_fields = ("serial_number", "model")
     formfield_overrides = {
@@ -29,6 +31,8 @@ class DeviceAdmin(ModelAdmin):
 @admin.register(DeviceConfiguration)
 class DeviceConfigurationAdmin(ModelAdmin):
     list_display = ("device", "created_at", "updated_at")
+    list_select_related = ("device",)
+    raw_id_fields = ("device",)
     formfield_overrides = {
         models.JSONField: {
             "widget": forms.Textarea(
@@ -1,7 +1,14 @@
+import hashlib
+
 from django.conf import settings
+from django.core.cache import cache
 from rest_framework import authentication, exceptions
 from rest_framework_api_key.models import APIKey
 
+# Settings are immutable after startup; resolve the header name once
+# instead of walking the lazy settings object on every request
+_CUSTOM_HEADER = getattr(settings, "API_KEY_CUSTOM_HEADER", "HTTP_X_API_KEY")
+
 
 class APIKeyAuthentication(authentication.BaseAuthentication):
     """
@@ -14,29 +21,43 @@ class APIKeyAuthentication(authentication.BaseAuthentication):
         if not api_key:
             return None
 
-        # Validate API key
+        # Validate API key, short-circuiting the DB lookup and hash compare
+        # for keys seen within the cache window
+        cache_timeout = getattr(settings, "API_KEY_CACHE_SECONDS", 0)
+        cache_key = None
+        if cache_timeout:
+            digest = hashlib.sha256(api_key.encode()).hexdigest()
+            cache_key = f"apikey:{digest}"
+            key_obj = cache.get(cache_key)
+            if key_obj is not None:
+                if not key_obj.is_active:
+                    raise exceptions.AuthenticationFailed("API key is inactive")
+                return (key_obj, api_key)
+
         try:
             key_obj = APIKey.objects.get_from_key(api_key)
             if not key_obj.is_active:
                 raise exceptions.AuthenticationFailed("API key is inactive")
 
+            if cache_key:
+                cache.set(cache_key, key_obj, timeout=cache_timeout)
+
             # Return user and key (DRF expects tuple of (user, auth))
             return (key_obj, api_key)
         except APIKey.DoesNotExist:
-            raise exceptions.AuthenticationFailed("Invalid API key")
+            raise exceptions.AuthenticationFailed("Invalid API key") from None
 
     def get_api_key(self, request):
         """Extract API key from request headers"""
-        custom_header = getattr(settings, "API_KEY_CUSTOM_HEADER", "HTTP_X_API_KEY")
-
         # Try custom header first
-        api_key = request.META.get(custom_header)
+        api_key = request.META.get(_CUSTOM_HEADER)
         if api_key:
             return api_key
 
         # Try Authorization header with Api-Key prefix
         auth = request.META.get("HTTP_AUTHORIZATION", "")
-        if auth.startswith("Api-Key "):
-            return auth[8:]  # Remove 'Api-Key ' prefix
+        stripped = auth.removeprefix("Api-Key ")
+        if stripped is not auth:
+            return stripped
 
         return None
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.17 on 2026-08-30 00:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('devices', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='device',
+            index=models.Index(fields=['model', 'firmware_version'], name='devices_dev_model_73e1bb_idx'),
+        ),
+    ]
@@ -0,0 +1,14 @@
+from django.utils.functional import cached_property
+
+
+class UserSitesQuerysetMixin:
+    """Memoizes the requesting user's site ids for the request lifetime.
+
+    DRF calls get_queryset more than once per request (list plus the
+    paginator's COUNT), so reading the ids through a cached_property
+    keeps the site subquery to a single execution per request.
+    """
+
+    @cached_property
+    def user_site_ids(self):
+        return list(self.request.user.sites.values_list("id", flat=True))
@@ -4,6 +4,35 @@ from django.contrib.auth.models import User
 from django.db import models
 
 
+class StaticRepresentationModel(models.Model):
+    """Caches the model repr in a column at save time.
+
+    Admin lists, dropdowns and audit views render ``str(obj)`` per row;
+    for models whose repr traverses foreign keys that is a query per row.
+    Subclasses describe their repr in ``static_representation`` and the
+    cached ``_str`` column is read everywhere else.
+    """
+
+    _str = models.CharField(max_length=255, editable=False, blank=True, default="")
+
+    class Meta:
+        abstract = True
+
+    def __str__(self):
+        return self._str or self.static_representation
+
+    def save(self, *args, **kwargs):
+        self._str = self.static_representation[:255]
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "_str" not in update_fields:
+            kwargs["update_fields"] = [*update_fields, "_str"]
+        super().save(*args, **kwargs)
+
+    @property
+    def static_representation(self):
+        raise NotImplementedError
+
+
 class Site(models.Model):
     """Represents a customer site/location"""
 
@@ -43,6 +72,11 @@ class Device(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["model", "firmware_version"]),
+        ]
+
     def __str__(self):
         return f"{self.serial_number} ({self.model})"
 
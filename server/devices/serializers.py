@@ -4,16 +4,13 @@ from .models import Device, DeviceConfiguration, FirmwareBundle, Site
 
 
 class SiteSerializer(serializers.ModelSerializer):
-    device_count = serializers.SerializerMethodField()
+    device_count = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = Site
         fields = ["id", "name", "address", "device_count", "created_at", "updated_at"]
         read_only_fields = ["id", "created_at", "updated_at"]
 
-    def get_device_count(self, obj):
-        return obj.devices.count()
-
 
 class DeviceConfigurationSerializer(serializers.ModelSerializer):
     class Meta:
@@ -52,6 +49,24 @@ class DeviceSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "created_at", "updated_at"]
 
 
+class DeviceListSerializer(DeviceSerializer):
+    """Slim list representation omitting the heavy JSON columns"""
+
+    class Meta(DeviceSerializer.Meta):
+        fields = [
+            "id",
+            "serial_number",
+            "model",
+            "firmware_version",
+            "site",
+            "site_name",
+            "status",
+            "last_seen",
+            "created_at",
+            "updated_at",
+        ]
+
+
 class FirmwareBundleSerializer(serializers.ModelSerializer):
     class Meta:
         model = FirmwareBundle
@@ -1,3 +1,4 @@
+from django.db.models import Count
 from rest_framework import viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
@@ -5,18 +6,21 @@ from rest_framework.response import Response
 from .models import Device, FirmwareBundle, Site
 from .serializers import (
     DeviceConfigurationSerializer,
+    DeviceListSerializer,
     DeviceSerializer,
     FirmwareBundleSerializer,
     SiteSerializer,
 )
 
+_VALID_DEVICE_STATUSES = frozenset(key for key, _ in Device.STATUS_CHOICES)
+
 
 class SiteViewSet(viewsets.ModelViewSet):
-    queryset = Site.objects.all()
+    queryset = Site.objects.none()
     serializer_class = SiteSerializer
 
     def get_queryset(self):
-        queryset = Site.objects.all()
+        queryset = Site.objects.annotate(device_count=Count("devices"))
         if self.request.user.is_authenticated:
             # Filter sites by user's access
             return queryset.filter(customer=self.request.user)
@@ -24,34 +28,55 @@ class SiteViewSet(viewsets.ModelViewSet):
 
 
 class DeviceViewSet(viewsets.ModelViewSet):
-    queryset = Device.objects.all()
+    queryset = Device.objects.none()
     serializer_class = DeviceSerializer
 
+    def get_serializer_class(self):
+        if self.action == "list":
+            return DeviceListSerializer
+        return DeviceSerializer
+
     def get_queryset(self):
-        queryset = Device.objects.select_related("site", "configuration")
+        if self.action == "list":
+            # Project only the columns the list serializer exposes; skips
+            # api_key/api_secret and the wide JSON columns entirely
+            queryset = Device.objects.select_related("site").only(
+                "id",
+                "serial_number",
+                "model",
+                "firmware_version",
+                "site",
+                "site__name",
+                "status",
+                "last_seen",
+                "created_at",
+                "updated_at",
+            )
+        else:
+            queryset = Device.objects.select_related("site", "configuration")
         if self.request.user.is_authenticated:
             # Filter devices by user's site access
-            user_sites = self.request.user.sites.all()
-            return queryset.filter(site__in=user_sites)
+            return queryset.filter(site__customer=self.request.user)
         return queryset.none()
 
     @action(detail=True, methods=["get"])
     def configuration(self, request, pk=None):
         """Get device configuration"""
         device = self.get_object()
-        if hasattr(device, "configuration"):
-            serializer = DeviceConfigurationSerializer(device.configuration)
-            return Response(serializer.data)
-        return Response({"error": "Configuration not found"}, status=404)
+        config = getattr(device, "configuration", None)
+        if config is None:
+            return Response({"error": "Configuration not found"}, status=404)
+        serializer = DeviceConfigurationSerializer(config)
+        return Response(serializer.data)
 
     @action(detail=True, methods=["post"])
     def update_status(self, request, pk=None):
         """Update device status"""
         device = self.get_object()
         new_status = request.data.get("status")
-        if new_status in dict(Device.STATUS_CHOICES):
+        if new_status in _VALID_DEVICE_STATUSES:
             device.status = new_status
-            device.save()
+            device.save(update_fields=["status", "updated_at"])
             serializer = self.get_serializer(device)
             return Response(serializer.data)
         return Response({"error": "Invalid status"}, status=400)
@@ -65,8 +90,10 @@ class FirmwareBundleViewSet(viewsets.ModelViewSet):
     def devices(self, request, pk=None):
         """Get devices compatible with this firmware"""
         firmware = self.get_object()
-        devices = Device.objects.filter(
-            model__in=firmware.supported_models, firmware_version__lt=firmware.version
+        data = list(
+            Device.objects.filter(
+                model__in=firmware.supported_models,
+                firmware_version__lt=firmware.version,
+            ).values("id", "serial_number", "model", "firmware_version")
         )
-        serializer = DeviceSerializer(devices, many=True)
-        return Response(serializer.data)
+        return Response(data)
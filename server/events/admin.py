@@ -9,6 +9,8 @@ from .models import AlertRule, EventLog, NotificationQueue, SystemEvent
 @admin.register(SystemEvent)
 class SystemEventAdmin(ModelAdmin):
     list_display = ("device", "event_type", "severity", "status", "created_at")
+    list_select_related = ("device",)
+    raw_id_fields = ("device", "resolved_by")
     list_filter = ("severity", "status", "event_type")
     search_fields = ("event_type", "device__serial_number")
     formfield_overrides = {
@@ -23,12 +25,14 @@ class SystemEventAdmin(ModelAdmin):
 @admin.register(EventLog)
 class EventLogAdmin(ModelAdmin):
     list_display = ("event", "action", "timestamp", "user")
+    list_select_related = ("event", "user")
     list_filter = ("timestamp",)
 
 
 @admin.register(AlertRule)
 class AlertRuleAdmin(ModelAdmin):
     list_display = ("name", "event_type", "severity", "is_active", "created_at")
+    raw_id_fields = ("device", "asset")
     list_filter = ("severity", "is_active")
     search_fields = ("name", "event_type")
     formfield_overrides = {
@@ -42,6 +46,8 @@ class AlertRuleAdmin(ModelAdmin):
 
 @admin.register(NotificationQueue)
 class NotificationQueueAdmin(ModelAdmin):
+    list_select_related = ("alert_rule", "event")
+    raw_id_fields = ("alert_rule", "event")
     list_display = (
         "alert_rule",
         "event",
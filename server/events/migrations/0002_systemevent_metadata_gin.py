@@ -0,0 +1,28 @@
+from django.db import migrations
+
+
+def add_metadata_gin_index(apps, schema_editor):
+    # GIN indexes only exist on PostgreSQL; the sqlite dev database keeps
+    # working without them.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS systemevent_metadata_gin "
+        "ON events_systemevent USING gin (metadata jsonb_path_ops)"
+    )
+
+
+def drop_metadata_gin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS systemevent_metadata_gin")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(add_metadata_gin_index, drop_metadata_gin_index),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.17 on 2026-08-30 00:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0002_systemevent_metadata_gin'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='alertrule',
+            name='_str',
+            field=models.CharField(blank=True, default='', editable=False, max_length=255),
+        ),
+        migrations.AddField(
+            model_name='notificationqueue',
+            name='_str',
+            field=models.CharField(blank=True, default='', editable=False, max_length=255),
+        ),
+        migrations.AddField(
+            model_name='systemevent',
+            name='_str',
+            field=models.CharField(blank=True, default='', editable=False, max_length=255),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.17 on 2026-08-30 00:40
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('devices', '0003_device_tags_gin'),
+        ('events', '0003_alertrule__str_notificationqueue__str_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='notificationqueue',
+            index=models.Index(fields=['alert_rule', 'status', 'next_retry_at'], name='events_noti_alert_r_49fcf7_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='systemevent',
+            index=models.Index(condition=models.Q(('status', 'active')), fields=['device', '-created_at'], name='sysevent_active_dev'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.17 on 2026-08-30 00:41
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('devices', '0003_device_tags_gin'),
+        ('events', '0004_notificationqueue_events_noti_alert_r_49fcf7_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='systemevent',
+            name='site',
+            field=models.ForeignKey(blank=True, editable=False, help_text='Denormalized from device.site for hot list filters', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='devices.site'),
+        ),
+    ]
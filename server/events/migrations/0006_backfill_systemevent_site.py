@@ -0,0 +1,22 @@
+from django.db import migrations
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_site(apps, schema_editor):
+    Device = apps.get_model("devices", "Device")
+    SystemEvent = apps.get_model("events", "SystemEvent")
+    SystemEvent.objects.filter(site__isnull=True).update(
+        site_id=Subquery(
+            Device.objects.filter(pk=OuterRef("device_id")).values("site_id")[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0005_systemevent_site"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_site, migrations.RunPython.noop),
+    ]
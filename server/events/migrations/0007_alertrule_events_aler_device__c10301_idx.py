@@ -0,0 +1,19 @@
+# Generated by Django 5.2.17 on 2026-08-30 00:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assets', '0003_assetcycle__str'),
+        ('devices', '0003_device_tags_gin'),
+        ('events', '0006_backfill_systemevent_site'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='alertrule',
+            index=models.Index(fields=['device', 'asset', 'is_active'], name='events_aler_device__c10301_idx'),
+        ),
+    ]
@@ -2,12 +2,13 @@ import uuid
 
 from django.contrib.auth.models import User
 from django.db import models
+from django.db.models import Q
 
 from assets.models import Asset
-from devices.models import Device
+from devices.models import Device, Site, StaticRepresentationModel
 
 
-class SystemEvent(models.Model):
+class SystemEvent(StaticRepresentationModel):
     """System events from devices"""
 
     SEVERITY_CHOICES = [
@@ -28,6 +29,15 @@ class SystemEvent(models.Model):
     device = models.ForeignKey(
         Device, on_delete=models.CASCADE, related_name="system_events"
     )
+    site = models.ForeignKey(
+        Site,
+        on_delete=models.CASCADE,
+        related_name="+",
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Denormalized from device.site for hot list filters",
+    )
     event_type = models.CharField(max_length=255)
     severity = models.CharField(
         max_length=20, choices=SEVERITY_CHOICES, default="medium"
@@ -53,9 +63,20 @@ class SystemEvent(models.Model):
             models.Index(fields=["event_type", "created_at"]),
             models.Index(fields=["severity", "created_at"]),
             models.Index(fields=["status", "created_at"]),
+            models.Index(
+                fields=["device", "-created_at"],
+                condition=Q(status="active"),
+                name="sysevent_active_dev",
+            ),
         ]
 
-    def __str__(self):
+    def save(self, *args, **kwargs):
+        if self.site_id is None and self.device_id:
+            self.site_id = self.device.site_id
+        super().save(*args, **kwargs)
+
+    @property
+    def static_representation(self):
         return f"{self.device.serial_number} - {self.event_type} ({self.severity})"
 
 
@@ -83,7 +104,7 @@ class EventLog(models.Model):
         return f"{self.event} - {self.action} at {self.timestamp}"
 
 
-class AlertRule(models.Model):
+class AlertRule(StaticRepresentationModel):
     """Alert rules and notification configuration"""
 
     name = models.CharField(max_length=255)
@@ -122,8 +143,12 @@ class AlertRule(models.Model):
 
     class Meta:
         unique_together = ["name", "device", "asset"]
+        indexes = [
+            models.Index(fields=["device", "asset", "is_active"]),
+        ]
 
-    def __str__(self):
+    @property
+    def static_representation(self):
         target = (
             self.device.serial_number
             if self.device
@@ -132,7 +157,7 @@ class AlertRule(models.Model):
         return f"{self.name} - {target}"
 
 
-class NotificationQueue(models.Model):
+class NotificationQueue(StaticRepresentationModel):
     """Pending alerts with delivery status and retries"""
 
     STATUS_CHOICES = [
@@ -164,7 +189,9 @@ class NotificationQueue(models.Model):
         indexes = [
             models.Index(fields=["status", "created_at"]),
             models.Index(fields=["next_retry_at"]),
+            models.Index(fields=["alert_rule", "status", "next_retry_at"]),
         ]
 
-    def __str__(self):
+    @property
+    def static_representation(self):
         return f"{self.alert_rule.name} - {self.channel} ({self.status})"
@@ -30,6 +30,27 @@ class SystemEventSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "created_at", "updated_at"]
 
 
+class SystemEventListSerializer(SystemEventSerializer):
+    """Slim list representation omitting the heavy JSON columns"""
+
+    class Meta(SystemEventSerializer.Meta):
+        fields = [
+            "id",
+            "device",
+            "device_serial",
+            "event_type",
+            "severity",
+            "description",
+            "status",
+            "duration",
+            "resolved_at",
+            "resolved_by",
+            "resolved_by_name",
+            "created_at",
+            "updated_at",
+        ]
+
+
 class AlertRuleSerializer(serializers.ModelSerializer):
     device_serial = serializers.CharField(
         source="device.serial_number", read_only=True, allow_null=True
@@ -6,6 +6,7 @@ from . import views
 router = DefaultRouter()
 router.register(r"events", views.SystemEventViewSet)
 router.register(r"rules", views.AlertRuleViewSet)
+router.register(r"logs", views.EventLogViewSet)
 router.register(r"notifications", views.NotificationQueueViewSet)
 
 urlpatterns = [
@@ -1,55 +1,83 @@
+from django.db.models import Q
+from django.utils import timezone
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import viewsets
 from rest_framework.decorators import action
 from rest_framework.filters import OrderingFilter
 from rest_framework.response import Response
 
-from .models import AlertRule, NotificationQueue, SystemEvent
+from devices.mixins import UserSitesQuerysetMixin
+
+from .models import AlertRule, EventLog, NotificationQueue, SystemEvent
 from .serializers import (
     AlertRuleSerializer,
+    EventLogSerializer,
     NotificationQueueSerializer,
+    SystemEventListSerializer,
     SystemEventSerializer,
 )
 
 
-class SystemEventViewSet(viewsets.ModelViewSet):
-    queryset = SystemEvent.objects.all()
+class SystemEventViewSet(UserSitesQuerysetMixin, viewsets.ModelViewSet):
+    queryset = SystemEvent.objects.none()
     serializer_class = SystemEventSerializer
     filter_backends = [DjangoFilterBackend, OrderingFilter]
     filterset_fields = ["device", "event_type", "severity", "status", "created_at"]
     ordering_fields = ["created_at", "severity"]
 
+    def get_serializer_class(self):
+        if self.action == "list":
+            return SystemEventListSerializer
+        return SystemEventSerializer
+
     def get_queryset(self):
         queryset = SystemEvent.objects.select_related("device", "resolved_by")
+        if self.action == "list":
+            # List responses omit the wide JSON columns entirely
+            queryset = queryset.defer("metadata")
         if self.request.user.is_authenticated:
-            # Filter by user's accessible devices
-            user_sites = self.request.user.sites.all()
-            return queryset.filter(device__site__in=user_sites)
+            # Filter on the denormalized site column (no device join)
+            return queryset.filter(site_id__in=self.user_site_ids)
         return queryset.none()
 
     @action(detail=True, methods=["post"])
     def acknowledge(self, request, pk=None):
         """Acknowledge an event"""
-        event = self.get_object()
-        event.status = "acknowledged"
-        event.save()
+        # Targeted UPDATE through the access-scoped queryset; avoids
+        # rewriting the full row (wide JSON metadata included)
+        updated = (
+            self.get_queryset()
+            .filter(pk=pk)
+            .update(status="acknowledged", updated_at=timezone.now())
+        )
+        if not updated:
+            return Response({"error": "Event not found"}, status=404)
+        event = SystemEvent.objects.select_related("device", "resolved_by").get(pk=pk)
         serializer = self.get_serializer(event)
         return Response(serializer.data)
 
     @action(detail=True, methods=["post"])
     def resolve(self, request, pk=None):
         """Resolve an event"""
-        event = self.get_object()
-        event.status = "resolved"
-        event.resolved_at = request.data.get("resolved_at")
-        event.resolved_by = request.user
-        event.save()
+        updated = (
+            self.get_queryset()
+            .filter(pk=pk)
+            .update(
+                status="resolved",
+                resolved_at=request.data.get("resolved_at"),
+                resolved_by=request.user,
+                updated_at=timezone.now(),
+            )
+        )
+        if not updated:
+            return Response({"error": "Event not found"}, status=404)
+        event = SystemEvent.objects.select_related("device", "resolved_by").get(pk=pk)
         serializer = self.get_serializer(event)
         return Response(serializer.data)
 
 
-class AlertRuleViewSet(viewsets.ModelViewSet):
-    queryset = AlertRule.objects.all()
+class AlertRuleViewSet(UserSitesQuerysetMixin, viewsets.ModelViewSet):
+    queryset = AlertRule.objects.none()
     serializer_class = AlertRuleSerializer
     filter_backends = [DjangoFilterBackend, OrderingFilter]
     filterset_fields = ["device", "asset", "event_type", "severity", "is_active"]
@@ -58,18 +86,32 @@ class AlertRuleViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         queryset = AlertRule.objects.select_related("device", "asset")
         if self.request.user.is_authenticated:
-            # Filter by user's accessible devices/assets
-            user_sites = self.request.user.sites.all()
-            return (
-                queryset.filter(device__site__in=user_sites)
-                | queryset.filter(asset__site__in=user_sites)
-                | queryset.filter(device__isnull=True, asset__isnull=True)
+            # Filter by user's accessible devices/assets in one SELECT
+            return queryset.filter(
+                Q(device__site_id__in=self.user_site_ids)
+                | Q(asset__site_id__in=self.user_site_ids)
+                | Q(device__isnull=True, asset__isnull=True)
             )
         return queryset.none()
 
 
-class NotificationQueueViewSet(viewsets.ReadOnlyModelViewSet):
-    queryset = NotificationQueue.objects.all()
+class EventLogViewSet(UserSitesQuerysetMixin, viewsets.ReadOnlyModelViewSet):
+    queryset = EventLog.objects.none()
+    serializer_class = EventLogSerializer
+    filter_backends = [DjangoFilterBackend, OrderingFilter]
+    filterset_fields = ["event", "action", "user"]
+    ordering_fields = ["timestamp"]
+
+    def get_queryset(self):
+        queryset = EventLog.objects.select_related("event", "user")
+        if self.request.user.is_authenticated:
+            # Filter via the event's denormalized site column
+            return queryset.filter(event__site_id__in=self.user_site_ids)
+        return queryset.none()
+
+
+class NotificationQueueViewSet(UserSitesQuerysetMixin, viewsets.ReadOnlyModelViewSet):
+    queryset = NotificationQueue.objects.none()
     serializer_class = NotificationQueueSerializer
     filter_backends = [DjangoFilterBackend, OrderingFilter]
     filterset_fields = ["alert_rule", "status", "channel", "created_at"]
@@ -79,8 +121,7 @@ class NotificationQueueViewSet(viewsets.ReadOnlyModelViewSet):
         queryset = NotificationQueue.objects.select_related("alert_rule", "event")
         if self.request.user.is_authenticated:
             # Filter by user's accessible alert rules
-            user_sites = self.request.user.sites.all()
             return queryset.filter(
-                alert_rule__device__site__in=user_sites
-            ) | queryset.filter(alert_rule__asset__site__in=user_sites)
+                alert_rule__device__site_id__in=self.user_site_ids
+            ) | queryset.filter(alert_rule__asset__site_id__in=self.user_site_ids)
         return queryset.none()
@@ -0,0 +1,55 @@
+import hashlib
+
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class HashingStream:
+    """File-like wrapper that tees every read into a SHA-256 hash."""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._hash = hashlib.sha256()
+
+    def read(self, *args, **kwargs):
+        chunk = self._stream.read(*args, **kwargs)
+        if chunk:
+            self._hash.update(chunk)
+        return chunk
+
+    def hexdigest(self):
+        return self._hash.hexdigest()
+
+
+class HashingJSONParser(JSONParser):
+    """JSON parser that hashes the raw body while parsing it.
+
+    The digest lands on the request as ``_computed_sha256`` so views can
+    verify a Content-SHA256 header without re-reading ``request.body``,
+    which would otherwise keep a second full copy of large batches alive.
+    """
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        if orjson is not None:
+            # orjson needs the full byte string anyway, so read once,
+            # hash the same buffer, and decode with the C parser
+            body = stream.read()
+            request = (parser_context or {}).get("request")
+            if request is not None:
+                request._computed_sha256 = hashlib.sha256(body).hexdigest()  # noqa: SLF001
+            try:
+                return orjson.loads(body)
+            except orjson.JSONDecodeError as exc:
+                raise ParseError(f"JSON parse error - {exc}") from exc
+
+        wrapped = HashingStream(stream)
+        data = super().parse(wrapped, media_type, parser_context)
+        request = (parser_context or {}).get("request")
+        if request is not None:
+            request._computed_sha256 = wrapped.hexdigest()  # noqa: SLF001
+        return data
@@ -0,0 +1,20 @@
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class OrjsonRenderer(JSONRenderer):
+    """JSON renderer backed by orjson when it is installed.
+
+    orjson encodes 2-5x faster than the stdlib with lower allocator
+    pressure; rendering falls back to the stock JSONRenderer where the
+    extension is unavailable.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or data is None:
+            return super().render(data, accepted_media_type, renderer_context)
+        return orjson.dumps(data, default=str)
@@ -2,10 +2,13 @@ import hashlib
 import uuid
 from datetime import datetime
 
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
 from django.utils import timezone
-from django.utils.dateparse import parse_datetime
 from rest_framework import status
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, permission_classes, renderer_classes
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
@@ -13,9 +16,59 @@ from devices.models import Device, FirmwareBundle
 from events.models import SystemEvent
 from telemetry.models import TelemetryPacket, TelemetryPoint
 
+from .parsers import HashingStream
+from .renderers import OrjsonRenderer
+from .tasks import (
+    build_telemetry_point,
+    build_telemetry_points,
+    build_telemetry_points_columnar,
+    insert_telemetry_points,
+    is_columnar_batch,
+    process_telemetry_packet,
+    touch_device_last_seen,
+)
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Batches below this size are processed inline; queueing them would cost
+# more in broker round-trips than the insert itself
+ASYNC_MIN_ROWS = 50
+
+# Uploads at or above this size are stream-parsed with ijson instead of
+# being materialized as one Python list
+STREAM_MIN_BYTES = 8 * 1024 * 1024
+STREAM_FLUSH_ROWS = 1000
+
+# Duplicate upload_ids are short-circuited in cache before touching the
+# DB; the (device, upload_id) unique constraint stays the backstop
+IDEMPOTENCY_TTL_SECONDS = 86400
+
+# Firmware changes rarely relative to device poll frequency, so OTA
+# lookups are served from cache for this long
+OTA_CACHE_SECONDS = 60
+_FW_CACHE_MISS = object()
+
+
+def _firmware_cache_key(model, channel_major):
+    generation = cache.get("fw:gen", 0)
+    return f"fw:{generation}:{model}:{channel_major}"
+
+
+@receiver(post_save, sender=FirmwareBundle)
+def _invalidate_firmware_cache(sender, **kwargs):
+    """Bump the cache generation whenever a bundle is saved."""
+    try:
+        cache.incr("fw:gen")
+    except ValueError:
+        cache.set("fw:gen", 1, None)
+
 
 @api_view(["POST"])
 @permission_classes([AllowAny])
+@renderer_classes([OrjsonRenderer])
 def auth_handshake(request):
     """Device authentication handshake endpoint"""
     # Return server time and nonce for device authentication
@@ -25,10 +78,81 @@ def auth_handshake(request):
     return Response({"nonce": nonce, "server_time": server_time, "version": "1.0.0"})
 
 
+def _telemetry_batch_streaming(request, device, idempotency_key, content_sha256):
+    """Bounded-memory ingest path for very large uploads.
+
+    Rows are parsed incrementally off the wire and flushed to the DB in
+    fixed-size chunks, so memory stays O(chunk) regardless of upload
+    size. The body hash accumulates during the same read, so the ledger
+    row is only created once the whole upload has validated — a
+    rejected upload leaves nothing behind to poison a retry.
+    """
+    # Cheap duplicate probe before parsing megabytes of body; the
+    # unique constraint below stays the correctness backstop
+    if TelemetryPacket.objects.filter(
+        device=device, upload_id=idempotency_key
+    ).exists():
+        return Response(
+            {"accepted": 0, "duplicates": 1, "rejected": 0},
+            status=status.HTTP_409_CONFLICT,
+        )
+
+    wrapped = HashingStream(request.stream)
+    accepted = 0
+    rejected = 0
+    buf = []
+    now = timezone.now()
+
+    try:
+        with transaction.atomic():
+            for item in ijson.items(wrapped, "item"):
+                try:
+                    buf.append(build_telemetry_point(device, item))
+                except Exception:
+                    rejected += 1
+                if len(buf) >= STREAM_FLUSH_ROWS:
+                    TelemetryPoint.objects.bulk_create(buf)
+                    accepted += len(buf)
+                    buf.clear()
+            if buf:
+                TelemetryPoint.objects.bulk_create(buf)
+                accepted += len(buf)
+
+            # Verify the hash accumulated during the read; a mismatch
+            # rolls the whole batch back
+            if content_sha256 and wrapped.hexdigest() != content_sha256:
+                raise ValueError("Content-SHA256 mismatch")
+
+            TelemetryPacket.objects.create(
+                device=device,
+                site_id=device.site_id,
+                upload_id=idempotency_key,
+                checksum=content_sha256 or "",
+                record_count=accepted,
+                status="processed",
+                processed_at=now,
+            )
+            touch_device_last_seen(device.pk, now)
+    except IntegrityError:
+        # A concurrent upload won the race; its rows are the batch
+        return Response(
+            {"accepted": 0, "duplicates": 1, "rejected": 0},
+            status=status.HTTP_409_CONFLICT,
+        )
+    except (ValueError, ijson.JSONError) as e:
+        # ijson.JSONError is not a ValueError, so malformed bodies
+        # need their own clause to come back as a 400
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    return Response({"accepted": accepted, "duplicates": 0, "rejected": rejected})
+
+
 @api_view(["POST"])
 @permission_classes([AllowAny])
+@renderer_classes([OrjsonRenderer])
 def telemetry_batch(request):
     """Batch telemetry data ingestion"""
+    idem_cache_key = None
     try:
         device_id = request.META.get("HTTP_X_DEVICE_ID")
         # Match spec header: X-Auth-Key (accept X-API-Key for backward-compat)
@@ -53,29 +177,57 @@ def telemetry_batch(request):
                 status=status.HTTP_401_UNAUTHORIZED,
             )
 
-        # Check for duplicate upload
-        if TelemetryPacket.objects.filter(
-            device=device, upload_id=idempotency_key
-        ).exists():
+        # Short-circuit duplicate uploads in cache before any DB work;
+        # retry storms then never reach the packet table. The unique
+        # constraint below stays the correctness backstop
+        idem_cache_key = f"idem:{device_id}:{idempotency_key}"
+        if not cache.add(idem_cache_key, 1, IDEMPOTENCY_TTL_SECONDS):
             return Response(
                 {"accepted": 0, "duplicates": 1, "rejected": 0},
                 status=status.HTTP_409_CONFLICT,
             )
 
-        # Process batch data
+        # Stream-parse very large uploads before DRF materializes the
+        # whole body as one Python list; columnar (v2) payloads are one
+        # object, not an array, so they skip the streaming path
+        batch_format = request.META.get("HTTP_X_BATCH_FORMAT", "")
+        content_length = int(request.META.get("CONTENT_LENGTH") or 0)
+        if (
+            ijson is not None
+            and content_length >= STREAM_MIN_BYTES
+            and batch_format != "columnar"
+        ):
+            response = _telemetry_batch_streaming(
+                request, device, idempotency_key, content_sha256
+            )
+            if response.status_code == status.HTTP_400_BAD_REQUEST:
+                # Nothing was recorded; let the device retry
+                cache.delete(idem_cache_key)
+            return response
+
+        # Process batch data: a row-oriented list (v1) or one object of
+        # parallel arrays (v2 columnar), which parses vectorized
         batch_data = request.data
-        if not isinstance(batch_data, list):
+        if is_columnar_batch(batch_data):
+            row_count = len(batch_data["timestamps"])
+        elif isinstance(batch_data, list):
+            row_count = len(batch_data)
+        else:
+            cache.delete(idem_cache_key)
             return Response(
-                {"error": "Batch data must be a list"},
+                {"error": "Batch data must be a list or a columnar object"},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # Optional: verify content hash if provided
+        # Optional: verify content hash if provided; the parser already
+        # hashed the body while reading it, so no second pass is needed
         if content_sha256:
             try:
-                raw_body = request.body or b""
-                calculated = hashlib.sha256(raw_body).hexdigest()
+                calculated = getattr(request, "_computed_sha256", None)
+                if calculated is None:
+                    calculated = hashlib.sha256(request.body or b"").hexdigest()
                 if calculated != content_sha256:
+                    cache.delete(idem_cache_key)
                     return Response(
                         {"error": "Content-SHA256 mismatch"},
                         status=status.HTTP_400_BAD_REQUEST,
@@ -83,59 +235,101 @@ def telemetry_batch(request):
             except Exception:
                 pass
 
-        # Create telemetry packet record
-        packet = TelemetryPacket.objects.create(
-            device=device,
-            upload_id=idempotency_key,
-            checksum=content_sha256 or "",
-            record_count=len(batch_data),
-            status="processing",
-        )
-
-        # Process individual telemetry points
-        accepted = 0
-        rejected = 0
+        # One ledger row serves both paths; the (device, upload_id)
+        # unique constraint is the idempotency check
+        try:
+            packet = TelemetryPacket.objects.create(
+                device=device,
+                site_id=device.site_id,
+                upload_id=idempotency_key,
+                checksum=content_sha256 or "",
+                record_count=row_count,
+                status="pending",
+            )
+        except IntegrityError:
+            return Response(
+                {"accepted": 0, "duplicates": 1, "rejected": 0},
+                status=status.HTTP_409_CONFLICT,
+            )
 
-        for item in batch_data:
+        # Large batches: hand parsing + insertion to the telemetry
+        # worker queue so the HTTP worker is free as soon as the body
+        # is validated
+        if row_count >= ASYNC_MIN_ROWS:
             try:
-                # Parse timestamp (expect ISO-8601 string)
-                ts = item.get("timestamp")
-                if isinstance(ts, str):
-                    ts_parsed = parse_datetime(ts)
-                else:
-                    ts_parsed = ts
-                if ts_parsed is None:
-                    ts_parsed = timezone.now()
-                TelemetryPoint.objects.create(
-                    device=device,
-                    timestamp=ts_parsed,
-                    metric=item.get("metric"),
-                    value=item.get("value"),
-                    unit=item.get("unit", ""),
-                    meta=item.get("meta", {}),
-                )
-                accepted += 1
+                process_telemetry_packet.delay(str(packet.id), batch_data)
             except Exception:
-                rejected += 1
+                # Broker unreachable (or the transport failed to
+                # resolve): fall through to inline processing instead
+                # of stranding a pending row that turns every retry
+                # into a 409
+                pass
+            else:
+                return Response(
+                    {
+                        "accepted": row_count,
+                        "duplicates": 0,
+                        "rejected": 0,
+                        "queued": True,
+                    },
+                    status=status.HTTP_202_ACCEPTED,
+                )
+
+        # Small batches (and enqueue failures): process inline to avoid
+        # broker overhead
+        packet.status = "processing"
+        packet.save(update_fields=["status"])
 
-        # Update packet status
-        packet.status = "processed"
-        packet.record_count = accepted
-        packet.processed_at = timezone.now()
-        packet.save()
+        if is_columnar_batch(batch_data):
+            try:
+                points, rejected = build_telemetry_points_columnar(device, batch_data)
+            except Exception as e:
+                # Columnar batches are all-or-nothing and nothing was
+                # stored; drop the ledger row along with the cache key
+                # so a corrected retry is not flagged as a duplicate
+                packet.delete()
+                cache.delete(idem_cache_key)
+                return Response(
+                    {"error": f"Malformed columnar batch: {e}"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+        else:
+            points, rejected = build_telemetry_points(device, batch_data)
 
-        # Update device last_seen
-        device.last_seen = timezone.now()
-        device.save()
+        now = timezone.now()
+        try:
+            with transaction.atomic():
+                insert_telemetry_points(points)
+
+                # Update packet status
+                packet.status = "processed"
+                packet.record_count = len(points)
+                packet.processed_at = now
+                packet.save(update_fields=["status", "record_count", "processed_at"])
+
+                # Update device last_seen without rewriting the full row,
+                # debounced for high-rate devices
+                touch_device_last_seen(device.pk, now)
+        except Exception:
+            # The transaction rolled back, so nothing was stored; drop
+            # the ledger row so the retry is not flagged as a duplicate
+            # (the outer handler clears the cache key)
+            packet.delete()
+            raise
 
-        return Response({"accepted": accepted, "duplicates": 0, "rejected": rejected})
+        return Response(
+            {"accepted": len(points), "duplicates": 0, "rejected": rejected}
+        )
 
     except Exception as e:
+        if idem_cache_key:
+            cache.delete(idem_cache_key)
         return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
 @api_view(["GET"])
 @permission_classes([AllowAny])
+@renderer_classes([OrjsonRenderer])
 def get_config(request):
     """Get device configuration"""
     try:
@@ -144,10 +338,12 @@ def get_config(request):
             "HTTP_X_API_KEY"
         )
 
-        device = Device.objects.get(id=device_id, api_key=api_key)
+        device = Device.objects.select_related("configuration").get(
+            id=device_id, api_key=api_key
+        )
 
-        if hasattr(device, "configuration"):
-            config = device.configuration
+        config = getattr(device, "configuration", None)
+        if config is not None:
             return Response(
                 {
                     "sampling_rates": config.sampling_rates,
@@ -171,6 +367,7 @@ def get_config(request):
 
 @api_view(["GET"])
 @permission_classes([AllowAny])
+@renderer_classes([OrjsonRenderer])
 def ota_check(request):
     """Check for OTA updates"""
     try:
@@ -181,18 +378,21 @@ def ota_check(request):
 
         device = Device.objects.get(id=device_id, api_key=api_key)
 
-        # Find latest firmware for device's model
-        firmware = (
-            FirmwareBundle.objects.filter(
-                supported_models__contains=[device.model],
-                channel__in=[
-                    "stable",
-                    device.firmware_version.split(".")[0],
-                ],  # Match major version
+        # Find latest firmware for device's model, cached per
+        # (model, channel) since polls vastly outnumber releases
+        channel_major = device.firmware_version.split(".")[0]
+        cache_key = _firmware_cache_key(device.model, channel_major)
+        firmware = cache.get(cache_key, _FW_CACHE_MISS)
+        if firmware is _FW_CACHE_MISS:
+            firmware = (
+                FirmwareBundle.objects.filter(
+                    supported_models__contains=[device.model],
+                    channel__in=["stable", channel_major],  # Match major version
+                )
+                .order_by("-created_at")
+                .first()
             )
-            .order_by("-created_at")
-            .first()
-        )
+            cache.set(cache_key, firmware, OTA_CACHE_SECONDS)
 
         if firmware and firmware.version != device.firmware_version:
             return Response(
@@ -214,6 +414,7 @@ def ota_check(request):
 
 @api_view(["POST"])
 @permission_classes([AllowAny])
+@renderer_classes([OrjsonRenderer])
 def ota_report(request):
     """Report OTA update status"""
     try:
@@ -245,7 +446,7 @@ def ota_report(request):
         # Update device firmware version if successful
         if status_update == "completed" and version:
             device.firmware_version = version
-            device.save()
+            device.save(update_fields=["firmware_version", "updated_at"])
 
         return Response({"status": "reported"})
 
@@ -2,10 +2,10 @@
 """
 Format script for the Django project.
 
-This script runs all formatting tools:
-- Ruff (with auto-fix)
-- Black (code formatter)
-- isort (import sorter)
+Runs Ruff only: `ruff check --fix` covers lint fixes and import sorting
+(the I rules are selected in pyproject.toml) and `ruff format` is
+black-compatible, so one tool replaces three interpreter startups and
+three file-tree walks per invocation.
 """
 
 import subprocess
@@ -17,7 +17,7 @@ def run_command(cmd: list[str], description: str) -> bool:
     """Run a command and return True if successful."""
     print(f"🔧 {description}")
     try:
-        result = subprocess.run(cmd, check=True, capture_output=False, text=True)
+        subprocess.run(cmd, check=True, capture_output=False, text=True)
         print(f"✅ {description} completed")
         return True
     except subprocess.CalledProcessError as e:
@@ -41,16 +41,12 @@ def main():
 
     success = True
 
-    # Run Ruff with auto-fix
+    # Run Ruff with auto-fix (includes import sorting via the I rules)
     if not run_command(["ruff", "check", ".", "--fix"], "Ruff auto-fix"):
         success = False
 
-    # Run Black formatter
-    if not run_command(["black", "."], "Black formatting"):
-        success = False
-
-    # Run isort
-    if not run_command(["isort", "."], "Import sorting"):
+    # Run Ruff formatter (black-compatible)
+    if not run_command(["ruff", "format", "."], "Ruff formatting"):
         success = False
 
     if success:
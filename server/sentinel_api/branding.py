@@ -1,14 +1,12 @@
-import os
+from os import environ
+from typing import Final
 
 # Brand and product naming for the admin UI and documentation
 # You can override these via environment variables: BRAND_NAME, PRODUCT_NAME, ADMIN_TITLE
 
-BRAND_NAME = os.getenv("BRAND_NAME", "Newmatik")
-PRODUCT_NAME = os.getenv("PRODUCT_NAME", "EsoCore")
+# Frozen at import so hot admin pages never re-read the environment
+_env = environ
 
-
-def _default_admin_title() -> str:
-    return f"{PRODUCT_NAME} Server"
-
-
-ADMIN_TITLE = os.getenv("ADMIN_TITLE", _default_admin_title())
+BRAND_NAME: Final[str] = _env.get("BRAND_NAME", "Newmatik")
+PRODUCT_NAME: Final[str] = _env.get("PRODUCT_NAME", "EsoCore")
+ADMIN_TITLE: Final[str] = _env.get("ADMIN_TITLE") or f"{PRODUCT_NAME} Server"
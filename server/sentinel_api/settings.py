@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 from django.templatetags.static import static
@@ -104,6 +105,9 @@ DATABASES = {
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
+# Join the profile into the per-request session user fetch
+AUTHENTICATION_BACKENDS = ["users.auth.ProfileModelBackend"]
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         "NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator",
@@ -206,11 +210,13 @@ REST_FRAMEWORK = {
     ],
     "DEFAULT_THROTTLE_RATES": {"anon": "100/hour", "user": "1000/hour"},
     "DEFAULT_RENDERER_CLASSES": [
-        "rest_framework.renderers.JSONRenderer",
+        # orjson-backed with a stdlib fallback; JSONField-heavy payloads
+        # (dashboard layouts, telemetry meta) encode several times faster
+        "iot.renderers.OrjsonRenderer",
         "rest_framework.renderers.BrowsableAPIRenderer",
     ],
     "DEFAULT_PARSER_CLASSES": [
-        "rest_framework.parsers.JSONParser",
+        "iot.parsers.HashingJSONParser",
         "rest_framework.parsers.MultiPartParser",
         "rest_framework.parsers.FormParser",
     ],
@@ -236,5 +242,28 @@ CORS_ALLOWED_ORIGINS = [
 
 CORS_ALLOW_CREDENTIALS = True
 
+# Celery configuration (telemetry ingestion offload)
+CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL", "redis://localhost:6379/0")
+# Route ingestion to its own queue so telemetry workers scale
+# independently of other background work
+CELERY_TASK_ROUTES = {"iot.tasks.*": {"queue": "telemetry"}}
+# Run tasks inline when no broker is available (local development)
+CELERY_TASK_ALWAYS_EAGER = os.getenv("CELERY_TASK_ALWAYS_EAGER", "1") == "1"
+# Keep the per-minute telemetry rollup view fresh
+CELERY_BEAT_SCHEDULE = {
+    "refresh-telemetry-rollups": {
+        "task": "telemetry.tasks.refresh_telemetry_rollups",
+        "schedule": 60.0,
+    },
+}
+
+# Serve the roles list as two UNIONed index scans instead of one OR
+# filter; worth enabling once the role table outgrows a bitmap OR scan
+USER_DEVICE_ROLE_USE_UNION = False
+
 # API Key configuration
 API_KEY_CUSTOM_HEADER = "HTTP_X_API_KEY"
+
+# Cache validated API keys for this many seconds to keep the hash compare and
+# DB lookup off the per-request hot path (0 disables caching)
+API_KEY_CACHE_SECONDS = 30
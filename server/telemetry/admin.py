@@ -9,6 +9,7 @@ from .models import TelemetryPacket, TelemetryPoint, TelemetryWindow
 @admin.register(TelemetryPacket)
 class TelemetryPacketAdmin(ModelAdmin):
     list_display = ("device", "upload_id", "status", "record_count", "created_at")
+    list_select_related = ("device",)
     list_filter = ("status", "created_at")
     search_fields = ("upload_id", "device__serial_number")
 
@@ -16,6 +17,7 @@ class TelemetryPacketAdmin(ModelAdmin):
 @admin.register(TelemetryPoint)
 class TelemetryPointAdmin(ModelAdmin):
     list_display = ("device", "metric", "timestamp", "value", "unit")
+    list_select_related = ("device",)
     list_filter = ("metric", "timestamp")
     search_fields = ("metric", "device__serial_number")
     formfield_overrides = {
@@ -29,6 +31,7 @@ class TelemetryPointAdmin(ModelAdmin):
 
 @admin.register(TelemetryWindow)
 class TelemetryWindowAdmin(ModelAdmin):
+    list_select_related = ("device",)
     list_display = (
         "device",
         "metric",
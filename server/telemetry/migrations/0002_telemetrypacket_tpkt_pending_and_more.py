@@ -0,0 +1,22 @@
+# Generated by Django 5.2.17 on 2026-08-30 00:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('devices', '0003_device_tags_gin'),
+        ('telemetry', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='telemetrypacket',
+            index=models.Index(condition=models.Q(('status', 'pending')), fields=['device', 'created_at'], name='tpkt_pending'),
+        ),
+        migrations.AddIndex(
+            model_name='telemetrypoint',
+            index=models.Index(fields=['device', '-timestamp'], name='tp_dev_ts_desc'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.17 on 2026-08-30 00:41
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('devices', '0003_device_tags_gin'),
+        ('telemetry', '0002_telemetrypacket_tpkt_pending_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='telemetrypacket',
+            name='site',
+            field=models.ForeignKey(blank=True, editable=False, help_text='Denormalized from device.site for hot list filters', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='devices.site'),
+        ),
+        migrations.AddField(
+            model_name='telemetrypoint',
+            name='site',
+            field=models.ForeignKey(blank=True, editable=False, help_text='Denormalized from device.site for hot list filters', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='devices.site'),
+        ),
+        migrations.AddField(
+            model_name='telemetrywindow',
+            name='site',
+            field=models.ForeignKey(blank=True, editable=False, help_text='Denormalized from device.site for hot list filters', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='devices.site'),
+        ),
+    ]
@@ -0,0 +1,22 @@
+from django.db import migrations
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_site(apps, schema_editor):
+    Device = apps.get_model("devices", "Device")
+    device_site = Subquery(
+        Device.objects.filter(pk=OuterRef("device_id")).values("site_id")[:1]
+    )
+    for model_name in ("TelemetryPacket", "TelemetryPoint", "TelemetryWindow"):
+        model = apps.get_model("telemetry", model_name)
+        model.objects.filter(site__isnull=True).update(site_id=device_site)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("telemetry", "0003_telemetrypacket_site_telemetrypoint_site_and_more"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_site, migrations.RunPython.noop),
+    ]
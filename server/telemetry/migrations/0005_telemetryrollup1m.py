@@ -0,0 +1,29 @@
+# Generated by Django 5.2.17 on 2026-08-30 00:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('telemetry', '0004_backfill_site'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TelemetryRollup1m',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('metric', models.CharField(max_length=255)),
+                ('bucket', models.DateTimeField()),
+                ('avg_value', models.FloatField(null=True)),
+                ('max_value', models.FloatField(null=True)),
+                ('std_value', models.FloatField(null=True)),
+                ('sample_count', models.BigIntegerField(default=0)),
+            ],
+            options={
+                'db_table': 'telemetry_point_1m',
+                'managed': False,
+            },
+        ),
+    ]
@@ -0,0 +1,41 @@
+from django.db import migrations
+
+
+def create_rollup_view(apps, schema_editor):
+    # Materialized views only exist on PostgreSQL; the sqlite dev
+    # database keeps working without them.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "CREATE MATERIALIZED VIEW IF NOT EXISTS telemetry_point_1m AS "
+        "SELECT row_number() OVER () AS id, "
+        "device_id, metric, "
+        'date_trunc(\'minute\', "timestamp") AS bucket, '
+        "avg(value) AS avg_value, "
+        "max(value) AS max_value, "
+        "stddev(value) AS std_value, "
+        "count(*) AS sample_count "
+        "FROM telemetry_telemetrypoint "
+        'GROUP BY device_id, metric, date_trunc(\'minute\', "timestamp")'
+    )
+    # The unique index is what lets REFRESH ... CONCURRENTLY work
+    schema_editor.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS telemetry_point_1m_uniq "
+        "ON telemetry_point_1m (device_id, metric, bucket)"
+    )
+
+
+def drop_rollup_view(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP MATERIALIZED VIEW IF EXISTS telemetry_point_1m")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("telemetry", "0005_telemetryrollup1m"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_rollup_view, drop_rollup_view),
+    ]
@@ -0,0 +1,43 @@
+from django.db import migrations
+
+
+def convert_to_hypertable(apps, schema_editor):
+    # Hypertables need PostgreSQL with the TimescaleDB extension loaded;
+    # plain PostgreSQL and the sqlite dev database keep working with the
+    # regular table.
+    connection = schema_editor.connection
+    if connection.vendor != "postgresql":
+        return
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'timescaledb'")
+        if cursor.fetchone() is None:
+            return
+
+    table = "telemetry_telemetrypoint"
+    # The partitioning column must appear in every unique constraint, so
+    # widen the primary key to (id, timestamp). id stays unique in
+    # practice (bigserial), so the Django model is unchanged.
+    schema_editor.execute(f"ALTER TABLE {table} DROP CONSTRAINT {table}_pkey")
+    schema_editor.execute(f'ALTER TABLE {table} ADD PRIMARY KEY (id, "timestamp")')
+    schema_editor.execute(
+        f"SELECT create_hypertable('{table}', 'timestamp', "
+        "chunk_time_interval => INTERVAL '1 day', migrate_data => TRUE)"
+    )
+    # Compress cold chunks, segmented so per-device/metric range scans
+    # stay cheap on compressed data
+    schema_editor.execute(
+        f"ALTER TABLE {table} SET (timescaledb.compress, "
+        "timescaledb.compress_segmentby = 'device_id,metric')"
+    )
+    schema_editor.execute(f"SELECT add_compression_policy('{table}', INTERVAL '7 days')")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("telemetry", "0006_telemetry_point_1m_view"),
+    ]
+
+    operations = [
+        # Converting back from a hypertable is not supported in place
+        migrations.RunPython(convert_to_hypertable, migrations.RunPython.noop),
+    ]
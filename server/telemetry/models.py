@@ -1,8 +1,9 @@
 import uuid
 
 from django.db import models
+from django.db.models import Q
 
-from devices.models import Device
+from devices.models import Device, Site
 
 
 class TelemetryPacket(models.Model):
@@ -19,6 +20,15 @@ class TelemetryPacket(models.Model):
     device = models.ForeignKey(
         Device, on_delete=models.CASCADE, related_name="telemetry_packets"
     )
+    site = models.ForeignKey(
+        Site,
+        on_delete=models.CASCADE,
+        related_name="+",
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Denormalized from device.site for hot list filters",
+    )
     upload_id = models.UUIDField(help_text="Client-generated upload identifier")
     checksum = models.CharField(max_length=128)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="pending")
@@ -32,11 +42,21 @@ class TelemetryPacket(models.Model):
         indexes = [
             models.Index(fields=["device", "created_at"]),
             models.Index(fields=["status", "created_at"]),
+            models.Index(
+                fields=["device", "created_at"],
+                condition=Q(status="pending"),
+                name="tpkt_pending",
+            ),
         ]
 
     def __str__(self):
         return f"{self.device.serial_number} - {self.upload_id}"
 
+    def save(self, *args, **kwargs):
+        if self.site_id is None and self.device_id:
+            self.site_id = self.device.site_id
+        super().save(*args, **kwargs)
+
 
 class TelemetryPoint(models.Model):
     """Individual telemetry data points"""
@@ -45,6 +65,15 @@ class TelemetryPoint(models.Model):
     device = models.ForeignKey(
         Device, on_delete=models.CASCADE, related_name="telemetry_points"
     )
+    site = models.ForeignKey(
+        Site,
+        on_delete=models.CASCADE,
+        related_name="+",
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Denormalized from device.site for hot list filters",
+    )
     timestamp = models.DateTimeField()
     metric = models.CharField(max_length=255)
     value = models.FloatField()
@@ -56,11 +85,17 @@ class TelemetryPoint(models.Model):
             models.Index(fields=["device", "timestamp"]),
             models.Index(fields=["device", "metric", "timestamp"]),
             models.Index(fields=["metric", "timestamp"]),
+            models.Index(fields=["device", "-timestamp"], name="tp_dev_ts_desc"),
         ]
 
     def __str__(self):
         return f"{self.device.serial_number} - {self.metric}: {self.value} at {self.timestamp}"
 
+    def save(self, *args, **kwargs):
+        if self.site_id is None and self.device_id:
+            self.site_id = self.device.site_id
+        super().save(*args, **kwargs)
+
 
 class TelemetryWindow(models.Model):
     """Aggregated telemetry windows (RMS, max, statistics)"""
@@ -69,6 +104,15 @@ class TelemetryWindow(models.Model):
     device = models.ForeignKey(
         Device, on_delete=models.CASCADE, related_name="telemetry_windows"
     )
+    site = models.ForeignKey(
+        Site,
+        on_delete=models.CASCADE,
+        related_name="+",
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Denormalized from device.site for hot list filters",
+    )
     timestamp = models.DateTimeField()
     metric = models.CharField(max_length=255)
     window_size_seconds = models.PositiveIntegerField(
@@ -88,3 +132,35 @@ class TelemetryWindow(models.Model):
 
     def __str__(self):
         return f"{self.device.serial_number} - {self.metric} window at {self.timestamp}"
+
+    def save(self, *args, **kwargs):
+        if self.site_id is None and self.device_id:
+            self.site_id = self.device.site_id
+        super().save(*args, **kwargs)
+
+
+class TelemetryRollup1m(models.Model):
+    """Per-minute aggregates over TelemetryPoint.
+
+    Backed by the ``telemetry_point_1m`` materialized view (PostgreSQL
+    only), refreshed every minute by ``telemetry.tasks``. Dashboards
+    read these pre-aggregated rows instead of re-scanning raw points.
+    """
+
+    id = models.BigIntegerField(primary_key=True)
+    device = models.ForeignKey(
+        Device, on_delete=models.DO_NOTHING, related_name="+", db_constraint=False
+    )
+    metric = models.CharField(max_length=255)
+    bucket = models.DateTimeField()
+    avg_value = models.FloatField(null=True)
+    max_value = models.FloatField(null=True)
+    std_value = models.FloatField(null=True)
+    sample_count = models.BigIntegerField(default=0)
+
+    class Meta:
+        managed = False
+        db_table = "telemetry_point_1m"
+
+    def __str__(self):
+        return f"{self.metric} rollup at {self.bucket}"
@@ -1,10 +1,10 @@
 from rest_framework import serializers
 
-from .models import TelemetryPacket, TelemetryPoint, TelemetryWindow
+from .models import TelemetryPacket, TelemetryPoint, TelemetryRollup1m, TelemetryWindow
 
 
 class TelemetryPacketSerializer(serializers.ModelSerializer):
-    device_serial = serializers.CharField(source="device.serial_number", read_only=True)
+    device_serial = serializers.CharField(read_only=True)
 
     class Meta:
         model = TelemetryPacket
@@ -24,7 +24,7 @@ class TelemetryPacketSerializer(serializers.ModelSerializer):
 
 
 class TelemetryPointSerializer(serializers.ModelSerializer):
-    device_serial = serializers.CharField(source="device.serial_number", read_only=True)
+    device_serial = serializers.CharField(read_only=True)
 
     class Meta:
         model = TelemetryPoint
@@ -41,8 +41,24 @@ class TelemetryPointSerializer(serializers.ModelSerializer):
         read_only_fields = ["id"]
 
 
+class TelemetryRollup1mSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = TelemetryRollup1m
+        fields = [
+            "id",
+            "device",
+            "metric",
+            "bucket",
+            "avg_value",
+            "max_value",
+            "std_value",
+            "sample_count",
+        ]
+        read_only_fields = fields
+
+
 class TelemetryWindowSerializer(serializers.ModelSerializer):
-    device_serial = serializers.CharField(source="device.serial_number", read_only=True)
+    device_serial = serializers.CharField(read_only=True)
 
     class Meta:
         model = TelemetryWindow
@@ -0,0 +1,15 @@
+from celery import shared_task
+from django.db import connection
+
+
+@shared_task
+def refresh_telemetry_rollups():
+    """Refresh the per-minute rollup view behind TelemetryRollup1m.
+
+    CONCURRENTLY keeps the view readable during the refresh; scheduled
+    every minute via CELERY_BEAT_SCHEDULE. No-op off PostgreSQL.
+    """
+    if connection.vendor != "postgresql":
+        return
+    with connection.cursor() as cursor:
+        cursor.execute("REFRESH MATERIALIZED VIEW CONCURRENTLY telemetry_point_1m")
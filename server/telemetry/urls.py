@@ -1,3 +1,4 @@
+from django.db import connection
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
@@ -7,6 +8,11 @@ router = DefaultRouter()
 router.register(r"packets", views.TelemetryPacketViewSet)
 router.register(r"points", views.TelemetryPointViewSet)
 router.register(r"windows", views.TelemetryWindowViewSet)
+if connection.vendor == "postgresql":
+    # The telemetry_point_1m materialized view only exists on
+    # PostgreSQL (the migration is a no-op elsewhere), so other
+    # backends get a plain 404 instead of an OperationalError
+    router.register(r"rollup/1m", views.TelemetryRollup1mViewSet)
 
 urlpatterns = [
     path("", include(router.urls)),
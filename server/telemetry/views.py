@@ -1,64 +1,111 @@
+from django.db.models import F
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import viewsets
 from rest_framework.filters import OrderingFilter
+from rest_framework.response import Response
 
-from .models import TelemetryPacket, TelemetryPoint, TelemetryWindow
+from devices.mixins import UserSitesQuerysetMixin
+
+from .models import TelemetryPacket, TelemetryPoint, TelemetryRollup1m, TelemetryWindow
 from .serializers import (
     TelemetryPacketSerializer,
     TelemetryPointSerializer,
+    TelemetryRollup1mSerializer,
     TelemetryWindowSerializer,
 )
 
 
-class TelemetryPacketViewSet(viewsets.ReadOnlyModelViewSet):
+class TelemetryPacketViewSet(UserSitesQuerysetMixin, viewsets.ReadOnlyModelViewSet):
     """Read-only viewset for telemetry packets"""
 
-    queryset = TelemetryPacket.objects.all()
+    queryset = TelemetryPacket.objects.none()
     serializer_class = TelemetryPacketSerializer
     filter_backends = [DjangoFilterBackend, OrderingFilter]
     filterset_fields = ["device", "status", "created_at"]
     ordering_fields = ["created_at", "processed_at"]
 
     def get_queryset(self):
-        queryset = TelemetryPacket.objects.select_related("device")
+        queryset = TelemetryPacket.objects.annotate(
+            device_serial=F("device__serial_number")
+        )
         if self.request.user.is_authenticated:
-            # Filter by user's accessible devices
-            user_sites = self.request.user.sites.all()
-            return queryset.filter(device__site__in=user_sites)
+            # Filter on the denormalized site column (no device join)
+            return queryset.filter(site_id__in=self.user_site_ids)
         return queryset.none()
 
 
-class TelemetryPointViewSet(viewsets.ReadOnlyModelViewSet):
+class TelemetryPointViewSet(UserSitesQuerysetMixin, viewsets.ReadOnlyModelViewSet):
     """Read-only viewset for telemetry points"""
 
-    queryset = TelemetryPoint.objects.all()
+    queryset = TelemetryPoint.objects.none()
     serializer_class = TelemetryPointSerializer
     filter_backends = [DjangoFilterBackend, OrderingFilter]
     filterset_fields = ["device", "metric", "timestamp"]
     ordering_fields = ["timestamp", "value"]
 
+    def list(self, request, *args, **kwargs):
+        # Point lists can run to millions of rows; serving values() dicts
+        # skips model instantiation and per-field serializer dispatch
+        queryset = self.filter_queryset(self.get_queryset()).values(
+            "id",
+            "device",
+            "device_serial",
+            "timestamp",
+            "metric",
+            "value",
+            "unit",
+            "meta",
+        )
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(list(page))
+        return Response(list(queryset))
+
     def get_queryset(self):
-        queryset = TelemetryPoint.objects.select_related("device")
+        queryset = TelemetryPoint.objects.annotate(
+            device_serial=F("device__serial_number")
+        )
         if self.request.user.is_authenticated:
-            # Filter by user's accessible devices
-            user_sites = self.request.user.sites.all()
-            return queryset.filter(device__site__in=user_sites)
+            # Filter on the denormalized site column (no device join)
+            return queryset.filter(site_id__in=self.user_site_ids)
         return queryset.none()
 
 
-class TelemetryWindowViewSet(viewsets.ReadOnlyModelViewSet):
+class TelemetryRollup1mViewSet(UserSitesQuerysetMixin, viewsets.ReadOnlyModelViewSet):
+    """Read-only viewset for per-minute telemetry rollups.
+
+    Serves the pre-aggregated materialized view so dashboards never
+    touch the raw points table. PostgreSQL only.
+    """
+
+    queryset = TelemetryRollup1m.objects.none()
+    serializer_class = TelemetryRollup1mSerializer
+    filter_backends = [DjangoFilterBackend, OrderingFilter]
+    filterset_fields = ["device", "metric", "bucket"]
+    ordering_fields = ["bucket", "sample_count"]
+
+    def get_queryset(self):
+        if self.request.user.is_authenticated:
+            return TelemetryRollup1m.objects.filter(
+                device__site_id__in=self.user_site_ids
+            )
+        return TelemetryRollup1m.objects.none()
+
+
+class TelemetryWindowViewSet(UserSitesQuerysetMixin, viewsets.ReadOnlyModelViewSet):
     """Read-only viewset for telemetry windows"""
 
-    queryset = TelemetryWindow.objects.all()
+    queryset = TelemetryWindow.objects.none()
     serializer_class = TelemetryWindowSerializer
     filter_backends = [DjangoFilterBackend, OrderingFilter]
     filterset_fields = ["device", "metric", "timestamp"]
     ordering_fields = ["timestamp", "sample_count"]
 
     def get_queryset(self):
-        queryset = TelemetryWindow.objects.select_related("device")
+        queryset = TelemetryWindow.objects.annotate(
+            device_serial=F("device__serial_number")
+        )
         if self.request.user.is_authenticated:
-            # Filter by user's accessible devices
-            user_sites = self.request.user.sites.all()
-            return queryset.filter(device__site__in=user_sites)
+            # Filter on the denormalized site column (no device join)
+            return queryset.filter(site_id__in=self.user_site_ids)
         return queryset.none()
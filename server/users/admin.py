@@ -9,6 +9,7 @@ from .models import Dashboard, UserDeviceRole, UserProfile
 @admin.register(UserProfile)
 class UserProfileAdmin(ModelAdmin):
     list_display = ("user", "company", "phone", "timezone", "is_active")
+    list_select_related = ("user",)
     list_filter = ("is_active",)
     search_fields = ("user__username", "company")
 
@@ -16,6 +17,7 @@ class UserProfileAdmin(ModelAdmin):
 @admin.register(UserDeviceRole)
 class UserDeviceRoleAdmin(ModelAdmin):
     list_display = ("user", "device", "site", "role", "is_active", "granted_at")
+    list_select_related = ("user", "device", "site")
     list_filter = ("role", "is_active")
     search_fields = ("user__username", "device__serial_number", "site__name")
 
@@ -23,6 +25,7 @@ class UserDeviceRoleAdmin(ModelAdmin):
 @admin.register(Dashboard)
 class DashboardAdmin(ModelAdmin):
     list_display = ("name", "user", "site", "is_default", "is_public")
+    list_select_related = ("user", "site")
     list_filter = ("is_default", "is_public")
     formfield_overrides = {
         models.JSONField: {
@@ -0,0 +1,21 @@
+from django.contrib.auth.backends import ModelBackend
+from django.contrib.auth.models import User
+
+
+class ProfileModelBackend(ModelBackend):
+    """
+    Model backend that joins the profile into the session user fetch
+
+    The auth middleware loads request.user once per request; pulling the
+    OneToOne profile in the same query means request.user.profile never
+    costs a second round-trip anywhere downstream.
+    """
+
+    def get_user(self, user_id):
+        try:
+            user = User._default_manager.select_related("profile").get(  # noqa: SLF001
+                pk=user_id
+            )
+        except User.DoesNotExist:
+            return None
+        return user if self.user_can_authenticate(user) else None
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.17 on 2026-08-30 01:02
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('devices', '0003_device_tags_gin'),
+        ('users', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='userdevicerole',
+            index=models.Index(fields=['user', 'is_active'], name='users_userd_user_id_09b81b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='userdevicerole',
+            index=models.Index(fields=['granted_by', 'is_active'], name='users_userd_granted_d54a36_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='userdevicerole',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['expires_at'], name='udr_active_expiry'),
+        ),
+    ]
@@ -1,5 +1,6 @@
 from django.contrib.auth.models import User
 from django.db import models
+from django.db.models import Q
 
 from devices.models import Device, Site
 
@@ -61,6 +62,16 @@ class UserDeviceRole(models.Model):
 
     class Meta:
         unique_together = ["user", "device", "site"]
+        indexes = [
+            # Both arms of the granted-or-own filter in the roles API
+            models.Index(fields=["user", "is_active"]),
+            models.Index(fields=["granted_by", "is_active"]),
+            models.Index(
+                fields=["expires_at"],
+                condition=Q(is_active=True),
+                name="udr_active_expiry",
+            ),
+        ]
 
     def __str__(self):
         target = (
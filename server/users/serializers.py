@@ -24,6 +24,63 @@ class UserProfileSerializer(serializers.ModelSerializer):
         read_only_fields = ["user", "created_at", "updated_at"]
 
 
+class CachedReadFieldsMixin:
+    """Serializer mixin that reuses one bound field set per class.
+
+    Instantiating a serializer deepcopies every declared field, which is
+    roughly half the cost of serializing a list. The read serializers
+    below have static, context-free field sets, so the fields bound by
+    the first instance can serve every later one. The cache is looked up
+    through ``__dict__`` so subclasses build their own set instead of
+    inheriting a parent's.
+    """
+
+    @property
+    def _readable_fields(self):
+        cls = type(self)
+        cached = cls.__dict__.get("_cached_readable_fields")
+        if cached is None:
+            cached = tuple(
+                field for field in self.fields.values() if not field.write_only
+            )
+            cls._cached_readable_fields = cached
+        return cached
+
+
+class UserProfileReadSerializer(CachedReadFieldsMixin, UserProfileSerializer):
+    """Fully read-only variant for GET actions.
+
+    Marking every field read-only lets DRF skip the writable-field
+    validation setup, which dominates serialization cost on lists.
+    Plain fields read the queryset annotations instead of walking
+    dotted sources through Field.get_attribute per row.
+    """
+
+    username = serializers.CharField(read_only=True)
+    email = serializers.EmailField(read_only=True)
+
+    class Meta(UserProfileSerializer.Meta):
+        read_only_fields = UserProfileSerializer.Meta.fields
+
+
+class UserProfileListSerializer(UserProfileReadSerializer):
+    """Slim list representation omitting the notification JSON"""
+
+    class Meta(UserProfileReadSerializer.Meta):
+        fields = [
+            "user",
+            "username",
+            "email",
+            "company",
+            "phone",
+            "timezone",
+            "is_active",
+            "created_at",
+            "updated_at",
+        ]
+        read_only_fields = fields
+
+
 class UserDeviceRoleSerializer(serializers.ModelSerializer):
     user_name = serializers.CharField(source="user.username", read_only=True)
     device_serial = serializers.CharField(
@@ -57,6 +114,44 @@ class UserDeviceRoleSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "granted_at"]
 
 
+class UserDeviceRoleReadSerializer(CachedReadFieldsMixin, UserDeviceRoleSerializer):
+    """Fully read-only variant for GET actions.
+
+    Plain fields read the queryset annotations instead of walking
+    dotted sources through Field.get_attribute per row.
+    """
+
+    user_name = serializers.CharField(read_only=True)
+    device_serial = serializers.CharField(read_only=True, allow_null=True)
+    site_name = serializers.CharField(read_only=True, allow_null=True)
+    granted_by_name = serializers.CharField(read_only=True, allow_null=True)
+
+    class Meta(UserDeviceRoleSerializer.Meta):
+        read_only_fields = UserDeviceRoleSerializer.Meta.fields
+
+
+class UserDeviceRoleListSerializer(UserDeviceRoleReadSerializer):
+    """Slim list representation omitting the permissions JSON"""
+
+    class Meta(UserDeviceRoleReadSerializer.Meta):
+        fields = [
+            "id",
+            "user",
+            "user_name",
+            "device",
+            "device_serial",
+            "site",
+            "site_name",
+            "role",
+            "granted_by",
+            "granted_by_name",
+            "granted_at",
+            "expires_at",
+            "is_active",
+        ]
+        read_only_fields = fields
+
+
 class DashboardSerializer(serializers.ModelSerializer):
     class Meta:
         model = Dashboard
@@ -72,3 +167,26 @@ class DashboardSerializer(serializers.ModelSerializer):
             "updated_at",
         ]
         read_only_fields = ["id", "created_at", "updated_at"]
+
+
+class DashboardReadSerializer(CachedReadFieldsMixin, DashboardSerializer):
+    """Fully read-only variant for GET actions"""
+
+    class Meta(DashboardSerializer.Meta):
+        read_only_fields = DashboardSerializer.Meta.fields
+
+
+class DashboardListSerializer(DashboardReadSerializer):
+    """Slim list representation omitting the layout/widget JSON"""
+
+    class Meta(DashboardReadSerializer.Meta):
+        fields = [
+            "id",
+            "name",
+            "site",
+            "is_default",
+            "is_public",
+            "created_at",
+            "updated_at",
+        ]
+        read_only_fields = fields
@@ -1,43 +1,118 @@
+from django.conf import settings
+from django.db.models import F, Q
 from rest_framework import viewsets
 
 from .models import Dashboard, UserDeviceRole, UserProfile
 from .serializers import (
+    DashboardListSerializer,
+    DashboardReadSerializer,
     DashboardSerializer,
+    UserDeviceRoleListSerializer,
+    UserDeviceRoleReadSerializer,
     UserDeviceRoleSerializer,
+    UserProfileListSerializer,
+    UserProfileReadSerializer,
     UserProfileSerializer,
 )
 
 
 class UserProfileViewSet(viewsets.ModelViewSet):
-    queryset = UserProfile.objects.all()
+    queryset = UserProfile.objects.none()
     serializer_class = UserProfileSerializer
 
+    def get_serializer_class(self):
+        if self.action == "list":
+            return UserProfileListSerializer
+        if self.action == "retrieve":
+            return UserProfileReadSerializer
+        return UserProfileSerializer
+
     def get_queryset(self):
-        # Users can only see their own profile
-        return UserProfile.objects.filter(user=self.request.user)
+        # Users can only see their own profile; the read serializer
+        # consumes these annotations instead of dotted-source walks
+        queryset = UserProfile.objects.select_related("user").annotate(
+            username=F("user__username"), email=F("user__email")
+        )
+        # The auth backend joined the profile into the session user
+        # fetch, so this resolves to a PK lookup instead of an FK filter
+        profile = getattr(self.request.user, "profile", None)
+        if profile is not None:
+            queryset = queryset.filter(pk=profile.pk)
+        else:
+            queryset = queryset.filter(user=self.request.user)
+        if self.action == "list":
+            # The slim list serializer never reads the notification JSON
+            return queryset.defer("notification_preferences")
+        return queryset
 
 
 class UserDeviceRoleViewSet(viewsets.ModelViewSet):
-    queryset = UserDeviceRole.objects.all()
+    queryset = UserDeviceRole.objects.none()
     serializer_class = UserDeviceRoleSerializer
 
+    def get_serializer_class(self):
+        if self.action == "list":
+            return UserDeviceRoleListSerializer
+        if self.action == "retrieve":
+            return UserDeviceRoleReadSerializer
+        return UserDeviceRoleSerializer
+
     def get_queryset(self):
-        queryset = UserDeviceRole.objects.select_related("user", "device", "site")
+        # The read serializer consumes these annotations instead of
+        # dotted-source walks; the writable serializer still reads the
+        # joined rows on create/update responses
+        queryset = UserDeviceRole.objects.select_related(
+            "user", "device", "site", "granted_by"
+        ).annotate(
+            user_name=F("user__username"),
+            device_serial=F("device__serial_number"),
+            site_name=F("site__name"),
+            granted_by_name=F("granted_by__username"),
+        )
+        if self.action == "list":
+            # The slim list serializer never reads the permissions JSON
+            queryset = queryset.defer("permissions")
         if self.request.user.is_authenticated:
             # Users can see roles they granted or roles for themselves
-            return queryset.filter(granted_by=self.request.user) | queryset.filter(
-                user=self.request.user
+            if self.action == "list" and getattr(
+                settings, "USER_DEVICE_ROLE_USE_UNION", False
+            ):
+                # Opt-in for large role tables: two index-driven SELECTs
+                # UNIONed (deduped without DISTINCT) beat a bitmap OR
+                # scan; list only, since union querysets reject the
+                # extra filter get_object applies
+                return queryset.filter(granted_by=self.request.user).union(
+                    queryset.filter(user=self.request.user)
+                )
+            # Default: a single Q keeps this one WHERE clause instead
+            # of a combined-queryset union
+            return queryset.filter(
+                Q(granted_by=self.request.user) | Q(user=self.request.user)
             )
         return queryset.none()
 
 
 class DashboardViewSet(viewsets.ModelViewSet):
-    queryset = Dashboard.objects.all()
+    queryset = Dashboard.objects.none()
     serializer_class = DashboardSerializer
 
+    def get_serializer_class(self):
+        if self.action == "list":
+            return DashboardListSerializer
+        if self.action == "retrieve":
+            return DashboardReadSerializer
+        return DashboardSerializer
+
     def get_queryset(self):
-        # Users can only see their own dashboards
-        return Dashboard.objects.filter(user=self.request.user)
+        # Users can only see their own dashboards; the serializer
+        # exposes site, so join it up front
+        queryset = Dashboard.objects.select_related("site").filter(
+            user=self.request.user
+        )
+        if self.action == "list":
+            # The slim list serializer never reads the layout/widget JSON
+            return queryset.defer("layout", "widgets")
+        return queryset
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)